@@ -1,7 +1,8 @@
 """Run the full arXiv digest pipeline: python -m arxiv_digest"""
 
-import subprocess
+import importlib
 import sys
+import traceback
 
 STEPS = [
     ("fetch", "Fetching papers from arXiv"),
@@ -15,15 +16,38 @@ STEPS = [
 ]
 
 
+def _run_step(module: str) -> bool:
+    """Run a step's main() in this interpreter.
+
+    Steps signal early, successful exits with sys.exit(0), so a SystemExit
+    with code 0/None counts as success; any other exit code or uncaught
+    exception is a failure.
+
+    Args:
+        module: Module name under the arxiv_digest package.
+
+    Returns:
+        True if the step succeeded.
+    """
+    saved_argv = sys.argv
+    sys.argv = [f"arxiv_digest.{module}"]
+    try:
+        importlib.import_module(f"arxiv_digest.{module}").main()
+    except SystemExit as exc:
+        return exc.code in (0, None)
+    except Exception:
+        traceback.print_exc()
+        return False
+    finally:
+        sys.argv = saved_argv
+    return True
+
+
 def main() -> None:
     print(f"arXiv Digest Pipeline — {len(STEPS)} steps\n")
     for module, description in STEPS:
         print(f"\n{'=' * 60}\nStep: {description}\n{'=' * 60}")
-        result = subprocess.run(
-            [sys.executable, "-m", f"arxiv_digest.{module}"],
-            check=False,
-        )
-        if result.returncode != 0:
+        if not _run_step(module):
             print(f"\nPipeline failed at step: {description}", file=sys.stderr)
             sys.exit(1)
     print("\nPipeline complete!")
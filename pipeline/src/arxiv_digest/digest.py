@@ -82,9 +82,8 @@ def generate_markdown(digest: dict) -> str:
         f"**Papers in this digest:** {selected_count} selected from {total_reviewed} top candidates"
     )
 
-    papers_markdown = ""
-    for i, paper in enumerate(papers, 1):
-        papers_markdown += PAPER_TEMPLATE.format(
+    papers_markdown = "".join(
+        PAPER_TEMPLATE.format(
             number=i,
             title=paper.get("title", "Untitled"),
             arxiv_id=paper.get("arxiv_id", "unknown"),
@@ -96,6 +95,8 @@ def generate_markdown(digest: dict) -> str:
             key_insight=paper.get("key_insight", "No key insight provided."),
             relevance=paper.get("relevance", "Relevance not specified."),
         )
+        for i, paper in enumerate(papers, 1)
+    )
 
     return MARKDOWN_TEMPLATE.format(
         date=date,
@@ -257,9 +258,10 @@ def _render_paper_card(paper: dict, index: int) -> str:
     relevance = html_lib.escape(paper.get("relevance", "Relevance not specified."))
     color = _score_color(score)
 
-    categories_html = ""
-    for cat in paper.get("categories", []):
-        categories_html += f'<span class="category-pill">{html_lib.escape(cat)}</span>'
+    categories_html = "".join(
+        f'<span class="category-pill">{html_lib.escape(cat)}</span>'
+        for cat in paper.get("categories", [])
+    )
 
     return f"""
     <div class="paper-card">
@@ -303,9 +305,7 @@ def generate_html(digest: dict) -> str:
     stats_html = f"""
     <div class="stats">{len(papers)} papers selected from {total_reviewed} top candidates</div>"""
 
-    papers_html = ""
-    for i, paper in enumerate(papers, 1):
-        papers_html += _render_paper_card(paper, i)
+    papers_html = "".join(_render_paper_card(paper, i) for i, paper in enumerate(papers, 1))
 
     footer_html = """
     <div class="footer">
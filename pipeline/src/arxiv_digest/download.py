@@ -22,7 +22,6 @@ import time
 from pathlib import Path
 
 from arxiv_digest.config import (
-    ARXIV_REQUEST_DELAY,
     DOWNLOAD_METADATA_PATH,
     PAPERS_DIR,
     SCORED_PAPERS_PATH,
@@ -269,11 +268,9 @@ def main() -> None:
     downloader = LaTeXDownloader(PAPERS_DIR)
     print(f"Output directory: {PAPERS_DIR.absolute()}\n")
 
+    # The extractor spaces requests by ARXIV_REQUEST_DELAY, so unpacking and
+    # converting one paper overlaps the wait before the next download.
     for i, paper in enumerate(papers):
-        if i > 0:
-            print(f"\nWaiting {ARXIV_REQUEST_DELAY}s (rate limit)...")
-            time.sleep(ARXIV_REQUEST_DELAY)
-
         arxiv_id = paper["arxiv_id"]
         print(f"\n[{i + 1}/{len(papers)}] {arxiv_id}: {paper.get('title', '')[:70]}")
         metadata = downloader.download_paper(paper)
@@ -18,6 +18,7 @@ import shutil
 import tarfile
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -29,6 +30,15 @@ from arxiv_digest.config import (
 )
 from arxiv_digest.utils import load_json, save_json
 
+_GZIP_MAGIC = b"\x1f\x8b"
+_INPUT_RE = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+
+# Author block parsing
+_AUTHOR_RE = re.compile(r"\\author\s*(?:\[[^\]]*\])?\s*\{")
+_AUTHOR_DECOR_RE = re.compile(r"\\(?:affiliation|thanks|email|inst|orcid|fnmark)\{[^}]*\}")
+_AUTHOR_MARK_RE = re.compile(r"\\(?:affiliationmark|thanksmark)\s*(?:\[[^\]]*\])?")
+_AUTHOR_SPLIT_RE = re.compile(r"\\and\b|\\\\|\band\b")
+
 
 class LaTeXParser:
     """Pure LaTeX parsing logic — no I/O, independently testable."""
@@ -36,77 +46,127 @@ class LaTeXParser:
     # Common main tex filenames, checked first
     _COMMON_NAMES = ("main.tex", "paper.tex", "ms.tex", "article.tex")
 
+    # Bytes read from the head of each candidate when looking for \documentclass
+    _HEAD_BYTES = 16384
+
+    # Minimum number of candidates before the fallback scan uses threads
+    _PARALLEL_SCAN_MIN = 16
+
+    @staticmethod
+    def _has_documentclass(tex_file: Path) -> bool:
+        r"""Check whether the head of ``tex_file`` contains ``\documentclass``."""
+        try:
+            with tex_file.open("rb") as f:
+                head = f.read(LaTeXParser._HEAD_BYTES)
+        except OSError:
+            return False
+        return b"\\documentclass" in head
+
     @staticmethod
     def find_main_tex_file(tex_dir: Path) -> Path | None:
         """Find the main ``.tex`` file containing ``\\documentclass``.
 
         Priority: common names (main.tex, paper.tex, etc.), then largest file
-        with ``\\documentclass``.
+        with ``\\documentclass``. Only the first ``_HEAD_BYTES`` of each file
+        are read, since the preamble always comes first.
         """
         tex_files = list(tex_dir.rglob("*.tex"))
         if not tex_files:
             return None
 
         # Check common names first
-        for name in LaTeXParser._COMMON_NAMES:
-            for tf in tex_files:
-                if tf.name == name:
-                    try:
-                        content = tf.read_text(encoding="utf-8", errors="replace")
-                        if r"\documentclass" in content:
-                            return tf
-                    except OSError:
-                        continue
-
-        # Fall back to largest file with \documentclass
-        candidates: list[tuple[int, Path]] = []
+        by_name: dict[str, list[Path]] = {}
         for tf in tex_files:
+            by_name.setdefault(tf.name, []).append(tf)
+        for name in LaTeXParser._COMMON_NAMES:
+            for tf in by_name.get(name, ()):
+                if LaTeXParser._has_documentclass(tf):
+                    return tf
+
+        # Fall back to largest file with \documentclass. Large source trees
+        # are scanned on a thread pool, since each head read blocks on I/O.
+        if len(tex_files) >= LaTeXParser._PARALLEL_SCAN_MIN:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                has_docclass = list(pool.map(LaTeXParser._has_documentclass, tex_files))
+        else:
+            has_docclass = [LaTeXParser._has_documentclass(tf) for tf in tex_files]
+
+        best: tuple[int, Path] | None = None
+        for tf, is_main in zip(tex_files, has_docclass, strict=True):
+            if not is_main:
+                continue
             try:
-                content = tf.read_text(encoding="utf-8", errors="replace")
-                if r"\documentclass" in content:
-                    candidates.append((len(content), tf))
+                size = tf.stat().st_size
             except OSError:
                 continue
+            if best is None or size > best[0]:
+                best = (size, tf)
 
-        if candidates:
-            candidates.sort(key=lambda x: x[0], reverse=True)
-            return candidates[0][1]
-
-        return None
+        return best[1] if best else None
 
     @staticmethod
-    def expand_inputs(content: str, base_dir: Path, depth: int = 0) -> str:
+    def expand_inputs(
+        content: str,
+        base_dir: Path,
+        depth: int = 0,
+        cache: dict[Path, str] | None = None,
+    ) -> str:
         r"""Recursively expand ``\input{}`` and ``\include{}`` directives.
 
         Args:
             content: LaTeX source text.
             base_dir: Directory to resolve relative paths against.
             depth: Current recursion depth (max 10).
+            cache: Already-read files for this expansion, so a file input
+                several times is only read from disk once.
 
         Returns:
             Content with input/include directives replaced by file contents.
         """
         if depth > 10:
             return content
+        if cache is None:
+            cache = {}
 
         def _replace(match: re.Match) -> str:
             filename = match.group(1)
             # Try with and without .tex extension
             for candidate in [base_dir / filename, base_dir / f"{filename}.tex"]:
-                if candidate.is_file():
+                sub_content = cache.get(candidate)
+                if sub_content is None:
+                    if not candidate.is_file():
+                        continue
                     try:
                         sub_content = candidate.read_text(encoding="utf-8", errors="replace")
-                        return LaTeXParser.expand_inputs(sub_content, candidate.parent, depth + 1)
                     except OSError:
                         return match.group(0)
+                    cache[candidate] = sub_content
+                return LaTeXParser.expand_inputs(sub_content, candidate.parent, depth + 1, cache)
             return match.group(0)
 
-        return re.sub(r"\\(?:input|include)\{([^}]+)\}", _replace, content)
+        return _INPUT_RE.sub(_replace, content)
 
     @staticmethod
     def strip_comments(content: str) -> str:
         r"""Remove LaTeX comments (``%`` to end of line), respecting ``\%``."""
-        return re.sub(r"(?<!\\)%.*", "", content)
+        parts: list[str] = []
+        pos = 0
+        while True:
+            i = content.find("%", pos)
+            if i < 0:
+                parts.append(content[pos:])
+                break
+            if i > 0 and content[i - 1] == "\\":
+                # Escaped percent — keep it and continue scanning
+                parts.append(content[pos : i + 1])
+                pos = i + 1
+                continue
+            parts.append(content[pos:i])
+            # Keep the newline itself; drop only the comment text
+            pos = content.find("\n", i)
+            if pos < 0:
+                break
+        return "".join(parts)
 
     @staticmethod
     def extract_braced_content(content: str, start_pos: int) -> str:
@@ -179,7 +239,7 @@ class LaTeXParser:
         Strips ``\affiliation{}``, ``\thanks{}``, ``\email{}``. Splits on
         ``\and``, ``\\``, or commas.
         """
-        match = re.search(r"\\author\s*(?:\[[^\]]*\])?\s*\{", content)
+        match = _AUTHOR_RE.search(content)
         if not match:
             return []
         brace_start = match.end() - 1
@@ -188,11 +248,11 @@ class LaTeXParser:
             return []
 
         # Remove sub-commands
-        raw = re.sub(r"\\(?:affiliation|thanks|email|inst|orcid|fnmark)\{[^}]*\}", "", raw)
-        raw = re.sub(r"\\(?:affiliationmark|thanksmark)\s*(?:\[[^\]]*\])?", "", raw)
+        raw = _AUTHOR_DECOR_RE.sub("", raw)
+        raw = _AUTHOR_MARK_RE.sub("", raw)
 
         # Split on \and, \\, or 'and' surrounded by whitespace
-        parts = re.split(r"\\and\b|\\\\|\band\b", raw)
+        parts = _AUTHOR_SPLIT_RE.split(raw)
         authors: list[str] = []
         for part in parts:
             # Further split by commas if multiple names remain
@@ -306,6 +366,32 @@ class LaTeXMetadataExtractor:
     def __init__(self) -> None:
         self.parser = LaTeXParser()
         self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0}
+        self._last_request: float | None = None
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Build a keep-alive session for arXiv e-print requests.
+
+        No adapter-level retries: they would fire inside ``session.get``,
+        bypassing ``_wait_for_rate_limit`` and arXiv's request spacing.
+        """
+        session = requests.Session()
+        session.headers.update(ARXIV_HEADERS)
+        return session
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep only for whatever remains of the arXiv request delay.
+
+        Time spent extracting and parsing the previous paper counts towards
+        the delay, so requests are spaced by ``ARXIV_REQUEST_DELAY`` without
+        adding it on top of the processing time.
+        """
+        if self._last_request is not None:
+            remaining = ARXIV_REQUEST_DELAY - (time.monotonic() - self._last_request)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_request = time.monotonic()
 
     def download_source(self, arxiv_id: str) -> bytes | None:
         """Download LaTeX source bundle from arXiv.
@@ -317,8 +403,9 @@ class LaTeXMetadataExtractor:
             Raw bytes of the source bundle, or None on failure.
         """
         url = f"https://arxiv.org/e-print/{arxiv_id}"
+        self._wait_for_rate_limit()
         try:
-            resp = requests.get(url, headers=ARXIV_HEADERS, timeout=30)
+            resp = self._session.get(url, timeout=30)
             if resp.status_code == 404:
                 return None
             resp.raise_for_status()
@@ -330,7 +417,9 @@ class LaTeXMetadataExtractor:
     def extract_source(self, data: bytes, extract_dir: Path) -> bool:
         """Extract LaTeX source archive to a directory.
 
-        Tries tar.gz, then gzip (single file), then plain text.
+        Dispatches on the gzip magic bytes: gzip data is extracted as a tar
+        archive when its first block is a valid tar header, otherwise as a
+        single ``.tex`` file. Anything else is treated as plain text.
         Filters tar members for path traversal safety.
 
         Args:
@@ -340,27 +429,31 @@ class LaTeXMetadataExtractor:
         Returns:
             True if extraction succeeded.
         """
-        # Try tar.gz
-        try:
-            with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
-                # Filter unsafe members
-                safe_members = []
-                for member in tar.getmembers():
-                    if member.name.startswith("/") or ".." in member.name:
-                        continue
-                    safe_members.append(member)
-                tar.extractall(path=extract_dir, members=safe_members, filter="data")
+        if data[:2] == _GZIP_MAGIC:
+            try:
+                with gzip.GzipFile(fileobj=io.BytesIO(data)) as gz:
+                    header = gz.read(tarfile.BLOCKSIZE)
+                try:
+                    tarfile.TarInfo.frombuf(header, tarfile.ENCODING, "surrogateescape")
+                    is_tar = True
+                except tarfile.HeaderError:
+                    is_tar = False
+
+                if not is_tar:
+                    # Plain gzip (single .tex file)
+                    (extract_dir / "main.tex").write_bytes(gzip.decompress(data))
+                    return True
+
+                # Stream members to disk as they are decompressed
+                with tarfile.open(fileobj=io.BytesIO(data), mode="r|gz") as tar:
+                    for member in tar:
+                        # Skip unsafe members
+                        if member.name.startswith("/") or ".." in member.name:
+                            continue
+                        tar.extract(member, path=extract_dir, filter="data")
                 return True
-        except (tarfile.TarError, gzip.BadGzipFile, EOFError):
-            pass
-
-        # Try plain gzip (single .tex file)
-        try:
-            decompressed = gzip.decompress(data)
-            (extract_dir / "main.tex").write_bytes(decompressed)
-            return True
-        except (gzip.BadGzipFile, OSError):
-            pass
+            except (tarfile.TarError, EOFError, OSError):
+                return False
 
         # Try plain text
         try:
@@ -469,9 +562,6 @@ def main() -> None:
     extractor = LaTeXMetadataExtractor()
 
     for i, paper in enumerate(papers):
-        if i > 0:
-            time.sleep(ARXIV_REQUEST_DELAY)
-
         metadata = extractor.process_paper(paper, i + 1, len(papers))
         if metadata is not None:
             paper["keywords"] = metadata["keywords"]
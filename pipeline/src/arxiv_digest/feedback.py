@@ -11,9 +11,10 @@ Usage:
 
 import argparse
 import json
-import re
+import os
 import sys
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 
 from arxiv_digest.config import RESOURCES_DIR, USER_PREFERENCES_PATH, load_llm_config
@@ -66,12 +67,29 @@ _DELTA_SCHEMA: dict = {
 
 # ── Date discovery ────────────────────────────────────────────────────────────
 
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+def _is_iso_date(name: str) -> bool:
+    """Return True if name has the YYYY-MM-DD shape.
 
-def find_digest_dates(resources_dir: Path) -> list[str]:
+    Checks length and separator positions first, which rejects most
+    non-date entries without looking at the digits.
+    """
+    return (
+        len(name) == 10
+        and name[4] == "-"
+        and name[7] == "-"
+        and name[:4].isdecimal()
+        and name[5:7].isdecimal()
+        and name[8:].isdecimal()
+    )
+
+
+def find_digest_dates(resources_dir: Path | str) -> list[str]:
     """Scan resources_dir for YYYY-MM-DD subdirs containing a digest_*.json.
 
+    Works on plain path strings from ``os.scandir`` throughout, so no
+    ``Path`` objects are created per entry.
+
     Args:
         resources_dir: Root directory to scan.
 
@@ -79,16 +97,19 @@ def find_digest_dates(resources_dir: Path) -> list[str]:
         Date strings sorted newest first.
     """
     dates = []
-    if not resources_dir.is_dir():
+    try:
+        it = os.scandir(os.fspath(resources_dir))
+    except (FileNotFoundError, NotADirectoryError):
         return dates
-    for entry in resources_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        if not _DATE_RE.match(entry.name):
-            continue
-        # Must contain at least one digest_*.json
-        if any(entry.glob("digest_*.json")):
-            dates.append(entry.name)
+    with it:
+        for entry in it:
+            if not _is_iso_date(entry.name) or not entry.is_dir(follow_symlinks=False):
+                continue
+            # Must contain at least one digest_*.json
+            with os.scandir(entry.path) as files:
+                if any(f.name.startswith("digest_") and f.name.endswith(".json") for f in files):
+                    dates.append(entry.name)
+    # ISO dates: lexicographic order is chronological order
     dates.sort(reverse=True)
     return dates
 
@@ -114,9 +135,8 @@ def load_digest_for_date(date_str: str, resources_dir: Path) -> dict:
     candidates = list(date_dir.glob("digest_*.json"))
     if not candidates:
         raise FileNotFoundError(f"No digest_*.json found in {date_dir}")
-    digest_path = sorted(candidates)[-1]
-    with digest_path.open() as f:
-        return json.load(f)
+    digest_path = max(candidates)
+    return json.loads(digest_path.read_bytes())
 
 
 # ── Feedback entry ────────────────────────────────────────────────────────────
@@ -145,11 +165,15 @@ def build_feedback_entry(paper: dict, feedback_type: str, feedback_text: str) ->
 
 # ── Delta application ─────────────────────────────────────────────────────────
 
+# Preference fields that apply_delta may change
+_PREFERENCE_KEYS = ("research_areas", "interests", "avoid")
+
 
 def apply_delta(prefs: dict, delta: dict) -> dict:
     """Apply an LLM-proposed delta to preferences dict.
 
-    Does not mutate the input. Returns an updated copy.
+    Does not mutate the input. Returns an updated copy in which only the
+    containers touched by the delta are copied; other values are shared.
 
     Args:
         prefs: Current user preferences dict.
@@ -158,19 +182,34 @@ def apply_delta(prefs: dict, delta: dict) -> dict:
     Returns:
         Updated preferences dict.
     """
-    import copy
-
-    updated = copy.deepcopy(prefs)
-    research_areas = updated.setdefault("research_areas", {})
+    # Copy-on-write: only the containers the delta touches are copied;
+    # untouched keys (llm, delivery, feedback_history, ...) stay shared.
+    updated = dict(prefs)
+    research_areas = dict(prefs.get("research_areas", {}))
+    updated["research_areas"] = research_areas
+    copied_areas: set[str] = set()
+
+    def _writable_area(cat: str) -> dict:
+        if cat not in copied_areas:
+            area = dict(research_areas[cat])
+            if "keywords" in area:
+                area["keywords"] = list(area["keywords"])
+            research_areas[cat] = area
+            copied_areas.add(cat)
+        return research_areas[cat]
 
     # Weight adjustments
     for cat, new_weight in delta.get("weight_adjustments", {}).items():
         if cat in research_areas:
-            research_areas[cat]["weight"] = new_weight
+            _writable_area(cat)["weight"] = new_weight
 
     # Add keywords
     for cat, kws in delta.get("add_keywords", {}).items():
-        area = research_areas.setdefault(cat, {"weight": 0.8, "keywords": []})
+        if cat in research_areas:
+            area = _writable_area(cat)
+        else:
+            area = research_areas[cat] = {"weight": 0.8, "keywords": []}
+            copied_areas.add(cat)
         existing = set(area.setdefault("keywords", []))
         for kw in kws:
             if kw not in existing:
@@ -181,23 +220,26 @@ def apply_delta(prefs: dict, delta: dict) -> dict:
     for cat, kws in delta.get("remove_keywords", {}).items():
         if cat in research_areas:
             to_remove = set(kws)
-            research_areas[cat]["keywords"] = [
-                k for k in research_areas[cat].get("keywords", []) if k not in to_remove
-            ]
+            area = _writable_area(cat)
+            area["keywords"] = [k for k in area.get("keywords", []) if k not in to_remove]
 
     # Interests
-    interests = updated.setdefault("interests", [])
+    interests = list(prefs.get("interests", []))
+    seen_interests = set(interests)
     for item in delta.get("add_interests", []):
-        if item not in interests:
+        if item not in seen_interests:
             interests.append(item)
+            seen_interests.add(item)
     to_remove_interests = set(delta.get("remove_interests", []))
     updated["interests"] = [i for i in interests if i not in to_remove_interests]
 
     # Avoid
-    avoid = updated.setdefault("avoid", [])
+    avoid = list(prefs.get("avoid", []))
+    seen_avoid = set(avoid)
     for item in delta.get("add_avoid", []):
-        if item not in avoid:
+        if item not in seen_avoid:
             avoid.append(item)
+            seen_avoid.add(item)
     to_remove_avoid = set(delta.get("remove_avoid", []))
     updated["avoid"] = [a for a in avoid if a not in to_remove_avoid]
 
@@ -293,13 +335,12 @@ def get_reviewed_info(feedback_history: list[dict]) -> tuple[set[str], set[str]]
     Returns:
         Tuple of (reviewed_dates, reviewed_paper_ids) as sets of strings.
     """
-    reviewed_dates: set[str] = set()
-    reviewed_paper_ids: set[str] = set()
-    for entry in feedback_history:
-        for d in entry.get("dates_reviewed", []):
-            reviewed_dates.add(d)
-        for pid in entry.get("reviewed_paper_ids", []):
-            reviewed_paper_ids.add(pid)
+    reviewed_dates = set(
+        chain.from_iterable(entry.get("dates_reviewed") or () for entry in feedback_history)
+    )
+    reviewed_paper_ids = set(
+        chain.from_iterable(entry.get("reviewed_paper_ids") or () for entry in feedback_history)
+    )
     return reviewed_dates, reviewed_paper_ids
 
 
@@ -562,20 +603,29 @@ def main() -> None:
 
     print()
 
-    # ── Confirm and apply ──
-    try:
-        answer = input("Apply these changes? [Y/n]: ").strip().lower()
-    except (EOFError, KeyboardInterrupt):
-        print("\nCancelled — no changes saved.")
-        sys.exit(0)
+    updated_prefs = apply_delta(existing_prefs, delta)
 
-    if answer not in ("", "y", "yes"):
-        print("Changes discarded.")
-        sys.exit(0)
+    # A proposed delta can still be a no-op (keyword already present, weight
+    # unchanged, ...); there is nothing to confirm then, but the reviewed
+    # dates and papers are still recorded so they aren't shown again
+    prefs_changed = any(updated_prefs.get(k) != existing_prefs.get(k) for k in _PREFERENCE_KEYS)
 
-    updated_prefs = apply_delta(existing_prefs, delta)
+    if prefs_changed:
+        # ── Confirm and apply ──
+        try:
+            answer = input("Apply these changes? [Y/n]: ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print("\nCancelled — no changes saved.")
+            sys.exit(0)
+
+        if answer not in ("", "y", "yes"):
+            print("Changes discarded.")
+            sys.exit(0)
+    else:
+        print("Proposed changes match current preferences — recording feedback only.")
+        updated_prefs = dict(existing_prefs)
 
-    # Append to feedback_history, increment update_count
+    # Append to feedback_history; only a real preference change bumps update_count
     history_entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),  # noqa: UP017
         "feedback_count": len(feedback_list),
@@ -583,15 +633,24 @@ def main() -> None:
         "reviewed_paper_ids": [e["arxiv_id"] for e in feedback_list],
         "reasoning": reasoning,
     }
-    updated_prefs.setdefault("feedback_history", []).append(history_entry)
-    updated_prefs["update_count"] = existing_prefs.get("update_count", 0) + 1
-    updated_prefs["last_updated"] = datetime.now(timezone.utc).isoformat()  # noqa: UP017
+    # apply_delta shares untouched values with existing_prefs, so build a
+    # new history list rather than appending to the shared one
+    updated_prefs["feedback_history"] = [
+        *existing_prefs.get("feedback_history", []),
+        history_entry,
+    ]
+    if prefs_changed:
+        updated_prefs["update_count"] = existing_prefs.get("update_count", 0) + 1
+        updated_prefs["last_updated"] = datetime.now(timezone.utc).isoformat()  # noqa: UP017
 
     with USER_PREFERENCES_PATH.open("w") as f:
         json.dump(updated_prefs, f, indent=2)
 
-    print(f"\nPreferences updated and saved to {USER_PREFERENCES_PATH}")
-    print(f"Update #{updated_prefs['update_count']} complete.")
+    if prefs_changed:
+        print(f"\nPreferences updated and saved to {USER_PREFERENCES_PATH}")
+        print(f"Update #{updated_prefs['update_count']} complete.")
+    else:
+        print(f"\nFeedback recorded in {USER_PREFERENCES_PATH}")
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 
 from arxiv_digest.config import (
+    ARXIV_REQUEST_DELAY,
     DAILY_PAPERS_PATH,
     USER_PREFERENCES_PATH,
     ensure_directories,
@@ -44,7 +45,7 @@ def fetch_arxiv_papers(
     base_url = "http://export.arxiv.org/api/query?"
     papers = []
 
-    for category in categories:
+    for i, category in enumerate(categories):
         print(f"Fetching papers from {category}...")
 
         # Build query
@@ -63,7 +64,8 @@ def fetch_arxiv_papers(
 
         try:
             # ArXiv API rate limit: max 1 request per 3 seconds
-            time.sleep(3)
+            if i > 0:
+                time.sleep(ARXIV_REQUEST_DELAY)
 
             with urllib.request.urlopen(url) as response:
                 data = response.read()
@@ -75,7 +77,8 @@ def fetch_arxiv_papers(
             ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
 
             # Extract papers
-            for entry in root.findall("atom:entry", ns):
+            entries = root.findall("atom:entry", ns)
+            for entry in entries:
                 paper = {}
 
                 # arXiv ID
@@ -122,7 +125,7 @@ def fetch_arxiv_papers(
 
                 papers.append(paper)
 
-            print(f"  Found {len(root.findall('atom:entry', ns))} papers in {category}")
+            print(f"  Found {len(entries)} papers in {category}")
 
         except Exception as e:
             print(f"  Error fetching {category}: {e}")
@@ -153,8 +153,8 @@ def extract_preferences_from_chat(chat: ChatSession) -> dict:
     extraction_response = chat.send(_EXTRACTION_PROMPT)
     text = extraction_response.strip()
     if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1])
+        # Drop the whole opening fence line, whatever language tag it carries
+        text = text.partition("\n")[2].removesuffix("```").strip()
     return json.loads(text)
 
 
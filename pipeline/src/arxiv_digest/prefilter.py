@@ -11,33 +11,69 @@ Usage:
 """
 
 import argparse
+import heapq
+from collections.abc import Set
+from functools import lru_cache
+from operator import itemgetter
 
 from arxiv_digest.config import DAILY_PAPERS_PATH, FILTERED_PAPERS_PATH, USER_PREFERENCES_PATH
 from arxiv_digest.utils import get_all_keywords, load_json, save_json
 
+# Avoidance term sets, matched as substrings of the lowercased title / abstract
+_BENCHMARK_TERMS = ("benchmark", "evaluation", "comparison", "survey")
+_THEORY_TERMS = ("theorem", "proof", "theory", "theoretical")
+_BENCHMARK_THEORY_TERMS = (*_THEORY_TERMS, "analysis")
+_ENGINEERING_TERMS = ("implementation", "system", "framework", "tool", "library")
 
-def prefilter_score(paper: dict, user_categories: set[str], user_keywords: set[str]) -> float:
+
+@lru_cache(maxsize=32)
+def _classify_avoidance(avoid_criteria: tuple[str, ...]) -> tuple[bool, bool]:
+    """Return ``(check_benchmark, check_engineering)`` for the given criteria.
+
+    Cached so the per-paper filter does not re-lowercase and re-scan the
+    criteria strings for every paper.
+    """
+    check_benchmark = False
+    check_engineering = False
+    for criterion in avoid_criteria:
+        criterion_lower = criterion.lower()
+        if "benchmark" in criterion_lower or "empirical" in criterion_lower:
+            check_benchmark = True
+        if "engineering" in criterion_lower or "implementation" in criterion_lower:
+            check_engineering = True
+    return check_benchmark, check_engineering
+
+
+def prefilter_score(
+    paper: dict,
+    user_categories: set[str] | frozenset[str],
+    user_keywords: Set[str],
+    *,
+    title_lower: str | None = None,
+    abstract_lower: str | None = None,
+) -> float:
     """
     Calculate a simple pre-filter score for a paper.
 
+    ``title_lower`` / ``abstract_lower`` may be passed to reuse text that
+    was already lowercased by the caller.
+
     Returns:
         Score from 0-10 based on category match and keyword presence
     """
-    score = 0.0
-
     # Category match (up to 6 points)
-    paper_categories = set(paper.get("categories", []))
-    category_overlap = paper_categories & user_categories
-
-    if category_overlap:
-        score += min(len(category_overlap) * 3, 6)  # 3 points per matching category, max 6
-    else:
+    category_matches = len(user_categories.intersection(paper.get("categories", ())))
+    if not category_matches:
         # No category match - likely to be filtered out
-        return score
+        return 0.0
+
+    score = float(min(category_matches * 3, 6))  # 3 points per matching category, max 6
 
     # Keyword match (up to 4 points)
-    title_lower = paper.get("title", "").lower()
-    abstract_lower = paper.get("abstract", "").lower()
+    if title_lower is None:
+        title_lower = paper.get("title", "").lower()
+    if abstract_lower is None:
+        abstract_lower = paper.get("abstract", "").lower()
 
     keyword_matches = 0
     for keyword in user_keywords:
@@ -45,47 +81,53 @@ def prefilter_score(paper: dict, user_categories: set[str], user_keywords: set[s
             keyword_matches += 2  # Title match worth more
         elif keyword in abstract_lower:
             keyword_matches += 1  # Abstract match
+        else:
+            continue
+        if keyword_matches >= 4:
+            break  # Cap reached; remaining keywords can't add anything
 
     score += min(keyword_matches, 4)  # Cap at 4 points
 
     return score
 
 
-def apply_avoidance_filters(paper: dict, avoid_criteria: list[str]) -> bool:
+def apply_avoidance_filters(
+    paper: dict,
+    avoid_criteria: list[str],
+    *,
+    title_lower: str | None = None,
+    abstract_lower: str | None = None,
+) -> bool:
     """
     Check if paper should be avoided based on criteria.
 
+    ``title_lower`` / ``abstract_lower`` may be passed to reuse text that
+    was already lowercased by the caller.
+
     Returns:
         True if paper should be KEPT, False if should be FILTERED OUT
     """
-    title_lower = paper.get("title", "").lower()
-    abstract_lower = paper.get("abstract", "").lower()
-
-    for criterion in avoid_criteria:
-        criterion_lower = criterion.lower()
-
-        # Check for benchmark papers
-        if "benchmark" in criterion_lower or "empirical" in criterion_lower:
-            benchmark_terms = ["benchmark", "evaluation", "comparison", "survey"]
-            has_benchmark = any(term in title_lower for term in benchmark_terms)
-
-            # Check if it has theoretical content
-            theory_terms = ["theorem", "proof", "theory", "theoretical", "analysis"]
-            has_theory = any(term in abstract_lower for term in theory_terms)
-
-            if has_benchmark and not has_theory:
-                return False  # Filter out pure benchmark papers
-
-        # Check for engineering-only papers
-        if "engineering" in criterion_lower or "implementation" in criterion_lower:
-            engineering_terms = ["implementation", "system", "framework", "tool", "library"]
-            has_engineering = any(term in title_lower for term in engineering_terms)
-
-            theory_terms = ["theorem", "proof", "theory", "theoretical"]
-            has_theory = any(term in abstract_lower for term in theory_terms)
-
-            if has_engineering and not has_theory:
-                return False  # Filter out implementation-only papers
+    if title_lower is None:
+        title_lower = paper.get("title", "").lower()
+    if abstract_lower is None:
+        abstract_lower = paper.get("abstract", "").lower()
+
+    check_benchmark, check_engineering = _classify_avoidance(tuple(avoid_criteria))
+
+    # Check for benchmark papers
+    if check_benchmark:
+        has_benchmark = any(term in title_lower for term in _BENCHMARK_TERMS)
+        # Check if it has theoretical content
+        has_theory = any(term in abstract_lower for term in _BENCHMARK_THEORY_TERMS)
+        if has_benchmark and not has_theory:
+            return False  # Filter out pure benchmark papers
+
+    # Check for engineering-only papers
+    if check_engineering:
+        has_engineering = any(term in title_lower for term in _ENGINEERING_TERMS)
+        has_theory = any(term in abstract_lower for term in _THEORY_TERMS)
+        if has_engineering and not has_theory:
+            return False  # Filter out implementation-only papers
 
     return True  # Keep the paper
 
@@ -102,7 +144,7 @@ def prefilter_papers(papers: list[dict], preferences: dict, target_count: int =
     Returns:
         Filtered list of papers
     """
-    user_categories = set(preferences["research_areas"].keys())
+    user_categories = frozenset(preferences["research_areas"])
     user_keywords = get_all_keywords(preferences)
     avoid_criteria = preferences.get("avoid", [])
 
@@ -111,31 +153,34 @@ def prefilter_papers(papers: list[dict], preferences: dict, target_count: int =
     print(f"Avoidance criteria: {len(avoid_criteria)}")
     print()
 
-    # Score all papers
-    scored_papers = []
+    # Score all papers, keeping scores beside (not inside) the paper dicts
+    scored_papers: list[tuple[float, dict]] = []
     for paper in papers:
+        # Lowercase once; both checks below scan the same text
+        title_lower = paper.get("title", "").lower()
+        abstract_lower = paper.get("abstract", "").lower()
+
         # Apply avoidance filters first
-        if not apply_avoidance_filters(paper, avoid_criteria):
+        if not apply_avoidance_filters(
+            paper, avoid_criteria, title_lower=title_lower, abstract_lower=abstract_lower
+        ):
             continue  # Skip this paper
 
         # Calculate pre-filter score
-        score = prefilter_score(paper, user_categories, user_keywords)
+        score = prefilter_score(
+            paper,
+            user_categories,
+            user_keywords,
+            title_lower=title_lower,
+            abstract_lower=abstract_lower,
+        )
 
         if score > 0:  # Only keep papers with some relevance
-            paper["prefilter_score"] = score
-            scored_papers.append(paper)
-
-    # Sort by score (highest first)
-    scored_papers.sort(key=lambda x: x["prefilter_score"], reverse=True)
-
-    # Take top N papers
-    filtered = scored_papers[:target_count]
-
-    # Remove prefilter_score from output (not needed by LLM scorer)
-    for paper in filtered:
-        del paper["prefilter_score"]
+            scored_papers.append((score, paper))
 
-    return filtered
+    # Take top N papers by score (highest first) without sorting the rest
+    top = heapq.nlargest(target_count, scored_papers, key=itemgetter(0))
+    return [paper for _, paper in top]
 
 
 def main():
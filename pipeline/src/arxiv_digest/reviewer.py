@@ -71,18 +71,20 @@ def _build_batch_analysis_prompt(
     """Build the deep-review prompt for a batch of papers."""
     interests_text = "\n".join(f"- {i}" for i in interests)
 
-    papers_text = ""
+    parts: list[str] = []
     for paper, full_text in batch:
-        if len(full_text) > _MAX_TEXT_LEN:
-            full_text = full_text[:_MAX_TEXT_LEN] + "\n\n[Text truncated for length]"
-        papers_text += (
+        truncated = len(full_text) > _MAX_TEXT_LEN
+        parts.append(
             f"\n{'=' * 60}\n"
             f"arxiv_id: {paper['arxiv_id']}\n"
             f"Title: {paper['title']}\n"
             f"Authors: {', '.join(paper.get('authors', []))}\n"
             f"Categories: {', '.join(paper.get('categories', []))}\n\n"
-            f"Full text:\n{full_text}\n"
+            "Full text:\n"
         )
+        parts.append(full_text[:_MAX_TEXT_LEN] if truncated else full_text)
+        parts.append("\n\n[Text truncated for length]\n" if truncated else "\n")
+    papers_text = "".join(parts)
 
     return (
         f"{build_persona(interests, research_areas)}\n\n"
@@ -150,14 +152,13 @@ def _build_selection_prompt(
     """Build the final selection prompt."""
     interests_text = "\n".join(f"- {i}" for i in interests)
 
-    papers_text = ""
-    for a in analyses:
-        papers_text += (
-            f"\n---\narxiv_id: {a['arxiv_id']}\n"
-            f"Title: {a['title']}\n"
-            f"Score: {a['analysis']['score']}\n"
-            f"Key insight: {a['analysis']['key_insight']}\n"
-        )
+    papers_text = "".join(
+        f"\n---\narxiv_id: {a['arxiv_id']}\n"
+        f"Title: {a['title']}\n"
+        f"Score: {a['analysis']['score']}\n"
+        f"Key insight: {a['analysis']['key_insight']}\n"
+        for a in analyses
+    )
 
     return (
         f"{build_persona(interests, research_areas or {})}\n\n"
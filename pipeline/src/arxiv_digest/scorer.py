@@ -10,6 +10,7 @@ Usage:
 
 import argparse
 import json
+from collections.abc import Set
 
 from arxiv_digest.config import (
     FILTERED_PAPERS_PATH,
@@ -25,6 +26,12 @@ from arxiv_digest.utils import get_all_keywords
 # ── Deterministic scoring functions ──────────────────────────────────
 
 
+# Avoidance term sets, matched as substrings of lowercased title / abstract
+_BENCHMARK_TERMS = ("benchmark", "evaluation", "survey", "comparison")
+_THEORY_TERMS = ("theorem", "proof", "theory", "theoretical")
+_ENGINEERING_TERMS = ("implementation", "system", "framework", "tool")
+
+
 def calculate_category_score(paper: dict, user_areas: dict) -> float:
     """Category relevance score (0-5).
 
@@ -33,24 +40,35 @@ def calculate_category_score(paper: dict, user_areas: dict) -> float:
     score = 0.0
     categories = paper.get("categories", [])
     for i, cat in enumerate(categories):
-        if cat in user_areas:
-            weight = user_areas[cat].get("weight", 1.0)
-            if i == 0:
-                score += 5 * weight
-            else:
-                score += 2.5 * weight
-    return min(score, 5.0)
-
-
-def calculate_keyword_score(paper: dict, all_keywords: set[str]) -> float:
+        area = user_areas.get(cat)
+        if area is None:
+            continue
+        weight = area.get("weight", 1.0)
+        score += 5 * weight if i == 0 else 2.5 * weight
+        # Already at the cap: later categories can't change the result
+        if score >= 5.0:
+            return 5.0
+    return score
+
+
+def calculate_keyword_score(
+    paper: dict,
+    all_keywords: Set[str],
+    *,
+    title_lower: str | None = None,
+    abstract_lower: str | None = None,
+) -> float:
     """Keyword presence score (0-3).
 
     Title match +2, LaTeX keywords +1, abstract match +0.5,
     LaTeX introduction +0.25 per keyword. Each keyword counted once
-    at its highest-value match.
+    at its highest-value match. Pass ``title_lower`` / ``abstract_lower``
+    to reuse already-lowercased text.
     """
-    title_lower = paper.get("title", "").lower()
-    abstract_lower = paper.get("abstract", "").lower()
+    if title_lower is None:
+        title_lower = paper.get("title", "").lower()
+    if abstract_lower is None:
+        abstract_lower = paper.get("abstract", "").lower()
     latex_keywords_lower = " ".join(paper.get("keywords", [])).lower()
     latex_intro_lower = paper.get("introduction", "").lower()
 
@@ -67,7 +85,12 @@ def calculate_keyword_score(paper: dict, all_keywords: set[str]) -> float:
     return min(score, 3.0)
 
 
-def calculate_novelty_bonus(paper: dict) -> int:
+def calculate_novelty_bonus(
+    paper: dict,
+    *,
+    title_lower: str | None = None,
+    abstract_lower: str | None = None,
+) -> int:
     """Novelty bonus (0 or 1). Awards 1 point when >= 2 indicator words match."""
     indicators = [
         "novel",
@@ -79,33 +102,41 @@ def calculate_novelty_bonus(paper: dict) -> int:
         "breakthrough",
         "significant advance",
     ]
-    text = (paper.get("title", "") + " " + paper.get("abstract", "")).lower()
+    if title_lower is None:
+        title_lower = paper.get("title", "").lower()
+    if abstract_lower is None:
+        abstract_lower = paper.get("abstract", "").lower()
+    text = f"{title_lower} {abstract_lower}"
     matches = sum(1 for ind in indicators if ind in text)
     return 1 if matches >= 2 else 0
 
 
-def calculate_avoidance_penalty(paper: dict, avoid_criteria: list[str]) -> float:
+def calculate_avoidance_penalty(
+    paper: dict,
+    avoid_criteria: list[str],
+    *,
+    title_lower: str | None = None,
+    abstract_lower: str | None = None,
+) -> float:
     """Avoidance penalty (0-3). Penalises benchmark / engineering papers lacking theory."""
     penalty = 0.0
-    title_lower = paper.get("title", "").lower()
-    abstract_lower = paper.get("abstract", "").lower()
+    if title_lower is None:
+        title_lower = paper.get("title", "").lower()
+    if abstract_lower is None:
+        abstract_lower = paper.get("abstract", "").lower()
 
     for criterion in avoid_criteria:
         criterion_lower = criterion.lower()
 
         if "empirical" in criterion_lower:
-            benchmark_terms = ["benchmark", "evaluation", "survey", "comparison"]
-            theory_terms = ["theorem", "proof", "theory", "theoretical"]
-            has_benchmark = any(t in title_lower for t in benchmark_terms)
-            has_theory = any(t in abstract_lower for t in theory_terms)
+            has_benchmark = any(t in title_lower for t in _BENCHMARK_TERMS)
+            has_theory = any(t in abstract_lower for t in _THEORY_TERMS)
             if has_benchmark and not has_theory:
                 penalty += 2
 
         if "engineering" in criterion_lower:
-            engineering_terms = ["implementation", "system", "framework", "tool"]
-            theory_terms_eng = ["theorem"]
-            has_engineering = any(t in title_lower for t in engineering_terms)
-            has_theory_eng = any(t in abstract_lower for t in theory_terms_eng)
+            has_engineering = any(t in title_lower for t in _ENGINEERING_TERMS)
+            has_theory_eng = "theorem" in abstract_lower
             if has_engineering and not has_theory_eng:
                 penalty += 1
 
@@ -137,14 +168,15 @@ def _build_interest_prompt(batch: list[dict], interests: list[str], research_are
     """Build the prompt for batched interest scoring."""
     interests_text = "\n".join(f"- {i}" for i in interests)
 
-    papers_text = ""
+    parts: list[str] = []
     for p in batch:
         abstract_snippet = p.get("abstract", "")[:500]
-        papers_text += (
+        parts.append(
             f"\n---\narxiv_id: {p['arxiv_id']}\nTitle: {p['title']}\nAbstract: {abstract_snippet}\n"
         )
         if p.get("keywords"):
-            papers_text += f"Keywords: {', '.join(p['keywords'])}\n"
+            parts.append(f"Keywords: {', '.join(p['keywords'])}\n")
+    papers_text = "".join(parts)
 
     return (
         f"{build_persona(interests, research_areas)}\n\n"
@@ -227,11 +259,20 @@ def score_papers(
     det_scores: dict[str, dict[str, float]] = {}
     for paper in papers:
         aid = paper["arxiv_id"]
+        # Lowercase once and share across the text-based scorers
+        title_lower = paper.get("title", "").lower()
+        abstract_lower = paper.get("abstract", "").lower()
         det_scores[aid] = {
             "category": calculate_category_score(paper, user_areas),
-            "keyword": calculate_keyword_score(paper, all_keywords),
-            "novelty": calculate_novelty_bonus(paper),
-            "avoidance": calculate_avoidance_penalty(paper, avoid),
+            "keyword": calculate_keyword_score(
+                paper, all_keywords, title_lower=title_lower, abstract_lower=abstract_lower
+            ),
+            "novelty": calculate_novelty_bonus(
+                paper, title_lower=title_lower, abstract_lower=abstract_lower
+            ),
+            "avoidance": calculate_avoidance_penalty(
+                paper, avoid, title_lower=title_lower, abstract_lower=abstract_lower
+            ),
         }
 
     # 2. LLM interest scores
@@ -201,7 +201,7 @@ def test_download_paper_integration(downloader: LaTeXDownloader, tmp_path: Path)
     mock_resp.content = tar_data
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("arxiv_digest.extract_latex.requests.get", return_value=mock_resp):
+    with patch("arxiv_digest.extract_latex.requests.Session.get", return_value=mock_resp):
         result = downloader.download_paper(PAPER)
 
     assert result["status"] == "success"
@@ -298,6 +298,17 @@ def test_find_main_tex_file_fallback(tmp_path: Path):
     assert result.name == "my_paper.tex"
 
 
+def test_find_main_tex_file_fallback_many_files(tmp_path: Path):
+    """Large source trees are scanned in parallel with the same result."""
+    for i in range(20):
+        (tmp_path / f"section{i}.tex").write_text(r"\section{Part}")
+    (tmp_path / "paper_v2.tex").write_text(r"\documentclass{article}" + "x" * 500)
+    (tmp_path / "short.tex").write_text(r"\documentclass{article}")
+    result = LaTeXParser.find_main_tex_file(tmp_path)
+    assert result is not None
+    assert result.name == "paper_v2.tex"
+
+
 def test_find_main_tex_file_none(tmp_path: Path):
     (tmp_path / "notes.txt").write_text("just notes")
     assert LaTeXParser.find_main_tex_file(tmp_path) is None
@@ -331,6 +342,18 @@ def test_expand_inputs_without_extension(tmp_path: Path):
     assert "Introduction text here" in result
 
 
+def test_expand_inputs_reads_repeated_file_once(tmp_path: Path):
+    """A file input several times should only be read from disk once."""
+    (tmp_path / "macros.tex").write_text("MACROS")
+    content = r"\input{macros} \input{macros} \include{macros}"
+
+    with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+        result = LaTeXParser.expand_inputs(content, tmp_path)
+
+    assert result == "MACROS MACROS MACROS"
+    assert mock_read.call_count == 1
+
+
 def test_expand_inputs_missing_file():
     """Missing input file should leave the directive in place."""
     content = r"\input{nonexistent}"
@@ -353,6 +376,22 @@ def test_parse_full(tmp_path: Path):
     assert result["keywords"] == []  # BASIC_DOC has no keywords
 
 
+def test_parse_rereads_input_files(tmp_path: Path):
+    """Re-parsing the same source picks up changes to \\input files."""
+    content = r"""\documentclass{article}
+\title{Test}
+\begin{document}
+\input{abs}
+\end{document}
+"""
+    abs_file = tmp_path / "abs.tex"
+    abs_file.write_text(r"\begin{abstract}First version.\end{abstract}")
+    assert "First version" in LaTeXParser.parse(content, tmp_path)["abstract"]
+
+    abs_file.write_text(r"\begin{abstract}Second version.\end{abstract}")
+    assert "Second version" in LaTeXParser.parse(content, tmp_path)["abstract"]
+
+
 # ── LaTeXMetadataExtractor: source extraction ────────────────────────
 
 
@@ -422,6 +461,33 @@ def test_extract_source_invalid_data(tmp_path: Path):
     assert not extractor.extract_source(b"not valid data at all \x00\x01\x02", tmp_path)
 
 
+# ── LaTeXMetadataExtractor: rate limiting ───────────────────────────
+
+
+def test_download_source_waits_only_remaining_delay():
+    """Time already spent since the last request counts towards the delay."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"data"
+
+    extractor = LaTeXMetadataExtractor()
+    with (
+        patch("arxiv_digest.extract_latex.requests.Session.get", return_value=mock_response),
+        patch("arxiv_digest.extract_latex.time.monotonic", side_effect=[100.0, 101.0, 101.0]),
+        patch("arxiv_digest.extract_latex.time.sleep") as mock_sleep,
+    ):
+        extractor.download_source("2501.00001")
+        extractor.download_source("2501.00002")
+
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_session_does_not_retry_behind_rate_limiter():
+    """Retries inside session.get would bypass the arXiv request spacing."""
+    extractor = LaTeXMetadataExtractor()
+    assert extractor._session.get_adapter("https://arxiv.org").max_retries.total == 0
+
+
 # ── LaTeXMetadataExtractor: process_paper integration ────────────────
 
 
@@ -442,7 +508,7 @@ def test_process_paper_integration(tmp_path: Path):
 
     extractor = LaTeXMetadataExtractor()
 
-    with patch("arxiv_digest.extract_latex.requests.get", return_value=mock_response):
+    with patch("arxiv_digest.extract_latex.requests.Session.get", return_value=mock_response):
         result = extractor.process_paper(paper, 1, 1)
 
     assert result is not None
@@ -461,7 +527,7 @@ def test_process_paper_download_failure():
     extractor = LaTeXMetadataExtractor()
 
     with patch(
-        "arxiv_digest.extract_latex.requests.get",
+        "arxiv_digest.extract_latex.requests.Session.get",
         return_value=mock_response,
     ) as mock_get:
         mock_get.return_value.status_code = 404
@@ -1,9 +1,11 @@
 """Tests for arxiv_digest.feedback pure functions."""
 
 import json
+from unittest.mock import MagicMock
 
 import pytest
 
+from arxiv_digest import feedback
 from arxiv_digest.feedback import (
     apply_delta,
     apply_preference_delta,
@@ -95,6 +97,12 @@ def test_find_digest_dates_empty(tmp_path):
     assert result == []
 
 
+def test_find_digest_dates_accepts_str_and_missing_dir(tmp_path):
+    _make_digest_dir(tmp_path, "2026-02-19")
+    assert find_digest_dates(str(tmp_path)) == ["2026-02-19"]
+    assert find_digest_dates(tmp_path / "missing") == []
+
+
 # ── load_digest_for_date ──────────────────────────────────────────────────────
 
 
@@ -259,6 +267,14 @@ def test_apply_delta_does_not_mutate_input(base_prefs):
     assert base_prefs == original
 
 
+def test_apply_delta_shares_untouched_values(base_prefs):
+    delta = {"weight_adjustments": {"cs.LG": 0.9}, "reasoning": "test"}
+    result = apply_delta(base_prefs, delta)
+    assert result["llm"] is base_prefs["llm"]
+    assert result["research_areas"]["stat.ML"] is base_prefs["research_areas"]["stat.ML"]
+    assert result["research_areas"]["cs.LG"] is not base_prefs["research_areas"]["cs.LG"]
+
+
 # ── get_reviewed_info ─────────────────────────────────────────────────────────
 
 
@@ -327,3 +343,60 @@ def test_build_feedback_prompt_returns_tuple(base_prefs):
 def test_aliases():
     assert apply_preference_delta is apply_delta
     assert get_available_digest_dates is find_digest_dates
+
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def run_feedback_main(tmp_path, monkeypatch, sample_paper, base_prefs):
+    """Run feedback.main() on one digest, rating its only paper as good."""
+    prefs_path = tmp_path / "user_preferences.json"
+    prefs_path.write_text(json.dumps({**base_prefs, "update_count": 2}))
+    _make_digest_dir(tmp_path, "2026-02-20")
+    (tmp_path / "2026-02-20" / "digest_2026-02-20.json").write_text(
+        json.dumps({"papers": [sample_paper]})
+    )
+
+    monkeypatch.setattr(feedback, "USER_PREFERENCES_PATH", prefs_path)
+    monkeypatch.setattr(feedback, "RESOURCES_DIR", tmp_path)
+    monkeypatch.setattr(feedback.sys, "argv", ["feedback", "--dates", "2026-02-20"])
+    monkeypatch.setattr(
+        feedback,
+        "load_llm_config",
+        lambda: {"provider": "gemini", "api_key": "k", "scorer_model": "m"},
+    )
+
+    def run(delta: dict, answers: list[str]) -> dict:
+        client = MagicMock()
+        client.complete_json.return_value = delta
+        monkeypatch.setattr(feedback, "create_client", lambda *a, **kw: client)
+        replies = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda _prompt="": next(replies))
+        feedback.main()
+        return json.loads(prefs_path.read_text())
+
+    return run
+
+
+def test_main_noop_delta_records_history_without_prompt(run_feedback_main, base_prefs):
+    # "diffusion" is already a cs.LG keyword, so the delta changes nothing;
+    # only the rating is answered, there is no "Apply these changes?" prompt
+    delta = {"add_keywords": {"cs.LG": ["diffusion"]}, "reasoning": "r"}
+    saved = run_feedback_main(delta, ["g"])
+
+    assert saved["research_areas"] == base_prefs["research_areas"]
+    assert saved["update_count"] == 2
+    assert "last_updated" not in saved
+    [entry] = saved["feedback_history"]
+    assert entry["dates_reviewed"] == ["2026-02-20"]
+    assert entry["reviewed_paper_ids"] == ["2602.99001"]
+
+
+def test_main_confirmed_delta_updates_preferences(run_feedback_main):
+    delta = {"add_keywords": {"cs.LG": ["score matching"]}, "reasoning": "r"}
+    saved = run_feedback_main(delta, ["g", "y"])
+
+    assert "score matching" in saved["research_areas"]["cs.LG"]["keywords"]
+    assert saved["update_count"] == 3
+    assert len(saved["feedback_history"]) == 1
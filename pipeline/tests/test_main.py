@@ -0,0 +1,79 @@
+"""Tests for the in-process pipeline runner in arxiv_digest.__main__."""
+
+import sys
+
+import pytest
+
+import arxiv_digest.__main__ as pipeline
+from arxiv_digest import deliver, digest
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def two_steps(monkeypatch):
+    """Reduce the pipeline to digest → deliver and record which mains ran."""
+    monkeypatch.setattr(pipeline, "STEPS", [("digest", "First"), ("deliver", "Second")])
+    calls: list[str] = []
+    monkeypatch.setattr(deliver, "main", lambda: calls.append("deliver"))
+    return calls
+
+
+# ── _run_step / main ──────────────────────────────────────────────────────────
+
+
+def test_successful_steps_all_run(two_steps, monkeypatch):
+    monkeypatch.setattr(digest, "main", lambda: two_steps.append("digest"))
+    pipeline.main()
+    assert two_steps == ["digest", "deliver"]
+
+
+@pytest.mark.parametrize("code", [0, None])
+def test_clean_exit_continues(two_steps, monkeypatch, code):
+    def step():
+        sys.exit(code)
+
+    monkeypatch.setattr(digest, "main", step)
+    pipeline.main()
+    assert two_steps == ["deliver"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [SystemExit(1), SystemExit(2), SystemExit("fatal"), RuntimeError("boom")],
+)
+def test_failure_stops_pipeline(two_steps, monkeypatch, capsys, error):
+    def step():
+        raise error
+
+    monkeypatch.setattr(digest, "main", step)
+    with pytest.raises(SystemExit) as exc_info:
+        pipeline.main()
+
+    assert exc_info.value.code == 1
+    assert two_steps == []
+    assert "Pipeline failed at step: First" in capsys.readouterr().err
+
+
+def test_argv_swapped_per_step_and_restored(two_steps, monkeypatch):
+    seen: list[list[str]] = []
+    monkeypatch.setattr(sys, "argv", ["arxiv_digest", "--unrelated"])
+    monkeypatch.setattr(digest, "main", lambda: seen.append(list(sys.argv)))
+
+    pipeline.main()
+
+    assert seen == [["arxiv_digest.digest"]]
+    assert sys.argv == ["arxiv_digest", "--unrelated"]
+
+
+def test_argv_restored_after_failure(two_steps, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["arxiv_digest"])
+
+    def step():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(digest, "main", step)
+    with pytest.raises(SystemExit):
+        pipeline.main()
+
+    assert sys.argv == ["arxiv_digest"]
@@ -48,9 +48,10 @@ def test_extract_parses_clean_json(sample_research_prefs):
     chat.send.assert_called_once()
 
 
-def test_extract_strips_markdown_fences(sample_research_prefs):
+@pytest.mark.parametrize("fence", ["```json", "```", "```JSON", "``` json", "```jsonc"])
+def test_extract_strips_markdown_fences(sample_research_prefs, fence):
     chat = MagicMock()
-    wrapped = "```json\n" + json.dumps(sample_research_prefs) + "\n```"
+    wrapped = fence + "\n" + json.dumps(sample_research_prefs) + "\n```"
     chat.send.return_value = wrapped
 
     result = extract_preferences_from_chat(chat)
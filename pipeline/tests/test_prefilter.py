@@ -1,6 +1,8 @@
 """Tests for arxiv_digest.prefilter pure functions."""
 
-from arxiv_digest.prefilter import apply_avoidance_filters, prefilter_score
+import pytest
+
+from arxiv_digest.prefilter import apply_avoidance_filters, prefilter_papers, prefilter_score
 from arxiv_digest.utils import get_all_keywords
 
 
@@ -38,24 +40,48 @@ def test_prefilter_score_title_beats_abstract(sample_preferences):
     assert score_title > score_abstract
 
 
-def test_apply_avoidance_filters_benchmark_no_theory():
-    paper = {
-        "title": "A Large-Scale Benchmark and Evaluation of Language Models",
-        "abstract": "We compare 50 models across 20 tasks using standard metrics.",
-    }
-    result = apply_avoidance_filters(paper, ["benchmark studies"])
-    assert result is False
+def test_prefilter_score_uses_precomputed_lowercase():
+    paper = {"title": "On Generative Models", "abstract": "", "categories": ["cs.LG"]}
+    score = prefilter_score(
+        paper, {"cs.LG"}, {"diffusion"}, title_lower="diffusion models", abstract_lower=""
+    )
+    assert score == 5.0
 
 
-def test_apply_avoidance_filters_benchmark_with_theory():
-    paper = {
-        "title": "Benchmark Analysis of Diffusion Models",
-        "abstract": "We prove a theorem showing that under certain conditions the evaluation error converges.",
-    }
+@pytest.mark.parametrize(
+    ("title", "abstract", "expected"),
+    [
+        (
+            "A Large-Scale Benchmark and Evaluation of Language Models",
+            "We compare 50 models across 20 tasks using standard metrics.",
+            False,
+        ),
+        (
+            "Benchmark Analysis of Diffusion Models",
+            "We prove a theorem showing that under certain conditions the evaluation error converges.",
+            True,
+        ),
+    ],
+    ids=["benchmark_no_theory", "benchmark_with_theory"],
+)
+def test_apply_avoidance_filters_benchmark(title, abstract, expected):
+    paper = {"title": title, "abstract": abstract}
     result = apply_avoidance_filters(paper, ["benchmark studies"])
-    assert result is True
+    assert result is expected
 
 
 def test_apply_avoidance_filters_no_criteria(sample_paper):
     result = apply_avoidance_filters(sample_paper, [])
     assert result is True
+
+
+def test_prefilter_papers_keeps_top_scores_in_order(sample_preferences):
+    papers = [
+        {"arxiv_id": "a", "title": "Plain", "abstract": "", "categories": ["cs.LG"]},
+        {"arxiv_id": "b", "title": "Diffusion", "abstract": "", "categories": ["cs.LG"]},
+        {"arxiv_id": "c", "title": "Unrelated", "abstract": "", "categories": ["math.AG"]},
+        {"arxiv_id": "d", "title": "Also plain", "abstract": "", "categories": ["cs.LG"]},
+    ]
+    result = prefilter_papers(papers, sample_preferences, target_count=2)
+    assert [p["arxiv_id"] for p in result] == ["b", "a"]
+    assert all("prefilter_score" not in p for p in papers)
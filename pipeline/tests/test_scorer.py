@@ -72,44 +72,62 @@ def test_calculate_keyword_score_cap():
     assert score == pytest.approx(3.0)
 
 
-# ── Novelty bonus ─────────────────────────────────────────────────────
+def test_calculate_keyword_score_uses_precomputed_lowercase():
+    """Precomputed lowercase text takes precedence over the paper fields."""
+    paper = {"title": "On Generative Models", "abstract": "We study other things."}
+    score = calculate_keyword_score(
+        paper, {"diffusion"}, title_lower="diffusion models", abstract_lower=""
+    )
+    assert score == pytest.approx(2.0)
 
 
-def test_calculate_novelty_bonus_high():
-    paper = {
-        "title": "A Novel Approach to Diffusion",
-        "abstract": "We prove a theorem showing breakthrough convergence.",
-    }
-    assert calculate_novelty_bonus(paper) == 1
+# ── Novelty bonus ─────────────────────────────────────────────────────
 
 
-def test_calculate_novelty_bonus_low():
-    paper = {
-        "title": "Incremental Improvements to Existing Methods",
-        "abstract": "We extend prior work with marginal gains.",
-    }
-    assert calculate_novelty_bonus(paper) == 0
+@pytest.mark.parametrize(
+    ("title", "abstract", "expected"),
+    [
+        (
+            "A Novel Approach to Diffusion",
+            "We prove a theorem showing breakthrough convergence.",
+            1,
+        ),
+        (
+            "Incremental Improvements to Existing Methods",
+            "We extend prior work with marginal gains.",
+            0,
+        ),
+    ],
+    ids=["high", "low"],
+)
+def test_calculate_novelty_bonus(title, abstract, expected):
+    paper = {"title": title, "abstract": abstract}
+    assert calculate_novelty_bonus(paper) == expected
 
 
 # ── Avoidance penalty ────────────────────────────────────────────────
 
 
-def test_calculate_avoidance_penalty_benchmark_no_theory():
-    paper = {
-        "title": "A Benchmark Evaluation of Language Models",
-        "abstract": "We compare 50 models using standard metrics.",
-    }
-    penalty = calculate_avoidance_penalty(paper, ["empirical studies"])
-    assert penalty == pytest.approx(2.0)
-
-
-def test_calculate_avoidance_penalty_benchmark_with_theory():
-    paper = {
-        "title": "A Benchmark for Proving Convergence",
-        "abstract": "We provide a theorem with proof of theoretical guarantees.",
-    }
+@pytest.mark.parametrize(
+    ("title", "abstract", "expected"),
+    [
+        (
+            "A Benchmark Evaluation of Language Models",
+            "We compare 50 models using standard metrics.",
+            2.0,
+        ),
+        (
+            "A Benchmark for Proving Convergence",
+            "We provide a theorem with proof of theoretical guarantees.",
+            0.0,
+        ),
+    ],
+    ids=["benchmark_no_theory", "benchmark_with_theory"],
+)
+def test_calculate_avoidance_penalty_benchmark(title, abstract, expected):
+    paper = {"title": title, "abstract": abstract}
     penalty = calculate_avoidance_penalty(paper, ["empirical studies"])
-    assert penalty == pytest.approx(0.0)
+    assert penalty == pytest.approx(expected)
 
 
 def test_calculate_avoidance_penalty_cap():
@@ -144,7 +162,7 @@ def test_brief_reason_low_scores():
 
 def test_get_all_keywords(sample_preferences):
     keywords = get_all_keywords(sample_preferences)
-    assert isinstance(keywords, set)
+    assert isinstance(keywords, frozenset)
     # All should be lowercase
     assert all(kw == kw.lower() for kw in keywords)
     # Check known keywords are present